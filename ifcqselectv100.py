@@ -29,13 +29,17 @@ bl_info = {
 }
 
 import bpy
+from bpy.app.handlers import persistent
 import re
 import os
+import functools
+import pickle
+import logging
+import mmap
 import traceback
 import bmesh
-import mathutils
+import numpy as np
 import ifcopenshell
-import hashlib
 import shutil
 
 # --- Open-source (MIT/LGPL) helper functions for robust IFC unit detection ---
@@ -46,9 +50,38 @@ try:
 except ImportError:
     IFCOPENSHELL_AVAILABLE = False
 
+# Results derived from an IFC file, keyed by (path, mtime, size) so that an
+# edited or replaced file on disk is picked up again.
+_IFC_CACHE = {}
+
+def get_ifc_cache_key(ifc_path):
+    return (ifc_path, os.path.getmtime(ifc_path), os.path.getsize(ifc_path))
+
+def get_ifc_cache_entry(ifc_path):
+    """
+    Return the cache dict for the current version of an IFC file.
+    Entries for older versions of the same path are dropped.
+    """
+    key = get_ifc_cache_key(ifc_path)
+    entry = _IFC_CACHE.get(key)
+    if entry is None:
+        if any(k[0] == ifc_path for k in _IFC_CACHE):
+            # Drop the old version, including its IfcOpenShell file
+            clear_ifc_cache(ifc_path)
+        entry = _IFC_CACHE[key] = {}
+    return entry
+
+def clear_ifc_cache(ifc_path=None):
+    """
+    Drop cached results for one IFC path, or for all files if no path is given.
+    """
+    for k in [k for k in _IFC_CACHE if ifc_path is None or k[0] == ifc_path]:
+        del _IFC_CACHE[k]
+
 def open_ifc_file(ifc_path):
     """
     Open an IFC file and return the IfcOpenShell file object.
+    The model is not kept; callers cache what they derive from it in the IFC cache entry.
     """
     return ifcopenshell.open(ifc_path)
 
@@ -120,6 +153,24 @@ QUANTITY_SETS = [
     "Qto_SlabBaseQuantities"
 ]
 
+# Geometry fallback per parameter, applied to an (N, 3) array of object dimensions
+PARAM_GEOM_FN = {
+    "Length": lambda d: d.max(axis=1),
+    "Width": lambda d: d.min(axis=1),
+    "Thickness": lambda d: d.min(axis=1),
+    "Height": lambda d: np.sort(d, axis=1)[:, 1],  # middle value
+    "Depth": lambda d: np.sort(d, axis=1)[:, 1],
+    "Perimeter": lambda d: 2 * (d[:, 0] + d[:, 1]),
+    "CrossSectionArea": lambda d: d[:, 0] * d[:, 1],
+    "OuterSurfaceArea": lambda d: d[:, 0] * d[:, 1],
+}
+
+# Parameters answered from geometry alone unless Strict BIM is requested
+_GEOM_ONLY_PARAMS = frozenset({
+    "Length", "Width", "Height", "Depth", "Perimeter",
+    "CrossSectionArea", "OuterSurfaceArea", "Thickness",
+})
+
 UNIT_SYSTEMS = [
     ("AUTO", "Auto (Detect from IFC/Blender)", ""),
     ("SI", "SI (Metric)", ""),
@@ -140,12 +191,31 @@ UNIT_MAP = {
 
 DEBUG_LOG_PATH = os.path.join(os.path.dirname(__file__), "ifc_quick_select_debug.log")
 
+# A single file handler is kept for the session instead of opening the log for
+# every message. The logger stays at INFO, so log_debug_info costs nothing until
+# the debug operator switches it to DEBUG.
+_logger = logging.getLogger("ifcqselect")
+_logger.setLevel(logging.INFO)
+_logger.propagate = False
+for _handler in list(_logger.handlers):
+    # Left over from a previous load of the addon
+    _logger.removeHandler(_handler)
+    _handler.close()
+_log_handler = logging.FileHandler(DEBUG_LOG_PATH, mode="a", encoding="utf-8", delay=True)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+_logger.addHandler(_log_handler)
+
 def log_debug_info(message):
-    with open(DEBUG_LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(message + "\n")
+    _logger.debug(message)
+
+def reset_debug_log(header=""):
+    # Close the handler first; it reopens the file on the next message
+    _log_handler.close()
+    with open(DEBUG_LOG_PATH, "w", encoding="utf-8") as f:
+        f.write(header)
 
 def log_detected_units():
-    ifc_units = get_ifc_project_units()
+    ifc_units = get_ifc_project_units(debug=True)
     blender_units = get_blender_scene_units()
     log_debug_info(f"Detected IFC units: {ifc_units}")
     log_debug_info(f"Detected Blender scene units: {blender_units}")
@@ -182,6 +252,12 @@ class IFCQSelectProps(bpy.types.PropertyGroup):
     ifc_file_path: bpy.props.StringProperty(
         name="IFC File Path", subtype='FILE_PATH', default=""
     )
+    ifc_cache_key: bpy.props.StringProperty(
+        name="IFC Cache Key",
+        description="Path, mtime and size of the IFC file whose parsed data is cached",
+        default="",
+        options={'HIDDEN'}
+    )
     strict_bim: bpy.props.BoolProperty(
         name="Strict BIM Properties",
         description="Only use BIM (IFC) properties for selection. No geometry fallback.",
@@ -206,6 +282,20 @@ class IFCQSelectProps(bpy.types.PropertyGroup):
     select_value_max: bpy.props.FloatProperty(name="Max Value", default=10000.0)
     name_contains: bpy.props.StringProperty(name="Name Contains", default="")
 
+class IFCQSelectObjectProps(bpy.types.PropertyGroup):
+    bim_display_cache: bpy.props.StringProperty(
+        name="BIM Display Cache",
+        description="Formatted BIMProperties lines shown in the panel, newline-separated",
+        default="",
+        options={'HIDDEN'}
+    )
+    bim_display_source: bpy.props.StringProperty(
+        name="BIM Display Source",
+        description="Snapshot of the BIMProperties keys and values the display cache was built from",
+        default="",
+        options={'HIDDEN'}
+    )
+
 def get_blender_scene_units():
     scene = bpy.context.scene
     us = scene.unit_settings
@@ -218,6 +308,34 @@ def get_blender_scene_units():
             return 'imperial'
     return 'meters'
 
+# Scene unit symbols by (system, length_unit); other imperial units report 'imperial'
+_AREA_UNIT = {
+    ('METRIC', 'METERS'): 'm²',
+    ('METRIC', 'MILLIMETERS'): 'mm²',
+    ('METRIC', 'CENTIMETERS'): 'cm²',
+    ('IMPERIAL', 'FEET'): 'ft²',
+    ('IMPERIAL', 'INCHES'): 'in²',
+}
+_VOLUME_UNIT = {
+    ('METRIC', 'METERS'): 'm³',
+    ('METRIC', 'MILLIMETERS'): 'mm³',
+    ('METRIC', 'CENTIMETERS'): 'cm³',
+    ('IMPERIAL', 'FEET'): 'ft³',
+    ('IMPERIAL', 'INCHES'): 'in³',
+}
+_IFC_VOLUME_UNIT = {'m': 'm³', 'ft': 'ft³', 'cm': 'cm³', 'mm': 'mm³'}
+
+def get_scene_unit_symbol(context, table, default):
+    try:
+        us = context.scene.unit_settings
+        key = (us.system, us.length_unit)
+    except Exception:
+        return default
+    unit = table.get(key)
+    if unit is None:
+        unit = 'imperial' if key[0] == 'IMPERIAL' else default
+    return unit
+
 def get_ifc_file_path():
     try:
         from bonsai.bim.ifc import IfcStore
@@ -227,27 +345,33 @@ def get_ifc_file_path():
         pass
     return None
 
-def get_ifc_project_units(force_fallback=False):
+def get_ifc_project_units(force_fallback=False, debug=False):
     props = bpy.context.scene.ifcqselect_props if hasattr(bpy.context.scene, 'ifcqselect_props') else None
     use_ifcopenshell = getattr(props, 'get_data_from_ifcopenshell', True) if props else True
     if not force_fallback and use_ifcopenshell and IFCOPENSHELL_AVAILABLE:
         ifc_path = get_ifc_file_path()
         if ifc_path and os.path.exists(ifc_path):
             try:
-                ifc_file = open_ifc_file(ifc_path)
-                units = get_ifc_units(ifc_file)
-                scales = get_ifc_unit_scales(ifc_file)
-                log_debug_info(f"[OpenSource] IFC file: {ifc_path}")
-                log_debug_info(f"[OpenSource] IFC units: {units}")
-                log_debug_info(f"[OpenSource] IFC unit scales: {scales}")
-                summary = {k: str(units[k]) for k in units}
-                return summary
+                entry = get_ifc_cache_entry(ifc_path)
+                if 'project_units' not in entry or (debug and 'project_unit_scales' not in entry):
+                    ifc_file = open_ifc_file(ifc_path)
+                    units = get_ifc_units(ifc_file)
+                    log_debug_info(f"[OpenSource] IFC file: {ifc_path}")
+                    log_debug_info(f"[OpenSource] IFC units: {units}")
+                    entry['project_units'] = {k: str(units[k]) for k in units}
+                    if debug:
+                        # Scales are not part of the summary; only computed for the debug log
+                        entry['project_unit_scales'] = get_ifc_unit_scales(ifc_file)
+                if debug:
+                    log_debug_info(f"[OpenSource] IFC unit scales: {entry['project_unit_scales']}")
+                return dict(entry['project_units'])
             except Exception as e:
                 log_debug_info(f"[OpenSource] IFC unit detection error: {e}")
     for obj in bpy.data.objects:
-        if hasattr(obj, "BIMProperties"):
-            if "IfcProject" in getattr(obj, "BIMProperties", {}):
-                for k, v in obj.BIMProperties.items():
+        bim = obj.get("BIMProperties")
+        if bim is not None:
+            if "IfcProject" in bim:
+                for k, v in bim.items():
                     if isinstance(v, dict):
                         for subk, subv in v.items():
                             if "unit" in subk.lower() and isinstance(subv, str):
@@ -263,37 +387,68 @@ def get_ifc_project_units(force_fallback=False):
     return None
 
 # --- Helper: Parse IFC file for entity relationships, properties, and GlobalId ---
+# The file is scanned once as raw bytes. Each alternative tokenizes one record
+# type completely inside the regex engine and ends with an empty marker group,
+# so m.lastgroup names the record type and no second match is needed.
+_IFCRECORD_PATTERNS = (
+    rb"IFCSLAB\('(?P<globalid>[^']+)',\$,'(?P<name>[\w_]+)'(?P<IFCSLAB>)",
+    rb"IFCELEMENTQUANTITY\([^,;]+,[^,;]+,'(?P<qset>[\w_]+)'(?P<qrefs>[^;]*);(?P<IFCELEMENTQUANTITY>)",
+    # Name, Description, Unit, Value, then Formula (IFC4) or the end (IFC2X3)
+    rb"IFCQUANTITY(?P<qtype>AREA|VOLUME)\('(?P<qname>[\w_]+)',[^,;]*,[^,;]*,(?P<qvalue>[\d\.Ee\+-]+)[,)](?P<IFCQUANTITY>)",
+    rb"IFCRELDEFINESBYPROPERTIES\([^,;]+,[^,;]+,[^,;]+,[^,;]+,\((?P<related>#[#\d,]+)\),#(?P<relating>\d+)\);(?P<IFCRELDEFINESBYPROPERTIES>)",
+)
+_RE_IFCRECORD = re.compile(rb"#(?P<eid>\d+)=(?:" + rb"|".join(_IFCRECORD_PATTERNS) + rb")")
+_RE_IFCREF = re.compile(rb'#(\d+)')
+
+def _decode(value):
+    return value.decode('utf-8', errors='ignore')
+
+def _scan_ifcslab(m, entities, rels, quantities, globalid_to_eid):
+    eid = int(m.group('eid'))
+    globalid = _decode(m.group('globalid'))
+    entities[eid] = {'globalid': globalid, 'name': _decode(m.group('name'))}
+    globalid_to_eid[globalid] = eid
+
+def _scan_ifcelementquantity(m, entities, rels, quantities, globalid_to_eid):
+    # Everything after the name only references the contained quantities
+    refs = [int(ref) for ref in _RE_IFCREF.findall(m.group('qrefs'))]
+    quantities[int(m.group('eid'))] = {'qset': _decode(m.group('qset')), 'quantities': refs}
+
+def _scan_ifcquantity(m, entities, rels, quantities, globalid_to_eid):
+    quantities[int(m.group('eid'))] = {
+        'type': _decode(m.group('qtype')),
+        'name': _decode(m.group('qname')),
+        'value': float(m.group('qvalue')),
+    }
+
+def _scan_ifcreldefinesbyproperties(m, entities, rels, quantities, globalid_to_eid):
+    qid = int(m.group('relating'))
+    for ent_id in m.group('related').split(b','):
+        rels[int(ent_id[1:])] = qid
+
+_IFC_RECORD_SCANNERS = {
+    'IFCSLAB': _scan_ifcslab,
+    'IFCELEMENTQUANTITY': _scan_ifcelementquantity,
+    'IFCQUANTITY': _scan_ifcquantity,
+    'IFCRELDEFINESBYPROPERTIES': _scan_ifcreldefinesbyproperties,
+}
+
 def parse_ifc_entities_and_quantities(ifc_path, debug=False):
     entities = {}
     rels = {}
     quantities = {}
     globalid_to_eid = {}
     try:
-        with open(ifc_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                # Parse IFCSLAB and other entities with GlobalId
-                m = re.match(r'#(\d+)=IFCSLAB\(\'([^\']+)\',\$,' + r"'([\w_]+)'", line)
-                if m:
-                    eid, globalid, name = m.groups()
-                    entities[eid] = {'globalid': globalid, 'name': name}
-                    globalid_to_eid[globalid] = eid
-                # Parse IFCELEMENTQUANTITY
-                m = re.match(r'#(\d+)=IFCELEMENTQUANTITY\([^,]+,[^,]+,' + r"'([\w_]+)'", line)
-                if m:
-                    qid, qset = m.groups()
-                    quantities[qid] = {'qset': qset, 'quantities': []}
-                # Parse IFCQUANTITYAREA and IFCQUANTITYVOLUME
-                m = re.match(r'#(\d+)=IFCQUANTITY(AREA|VOLUME)\(' + r"'([\w_]+)'" + r',\$\$,([\d\.Ee\+-]+),', line)
-                if m:
-                    qid, qtype, qname, qval = m.groups()
-                    quantities[qid] = {'type': qtype, 'name': qname, 'value': float(qval)}
-                # Parse IFCRELDEFINESBYPROPERTIES
-                m = re.match(r'#(\d+)=IFCRELDEFINESBYPROPERTIES\([^,]+,[^,]+,[^,]+,[^,]+,\((#[\d,]+)\),#(\d+)\);', line)
-                if m:
-                    rid, ent_ids, qid = m.groups()
-                    ent_ids = [x.replace('#','') for x in ent_ids.split(',')]
-                    for eid in ent_ids:
-                        rels[eid] = qid
+        with open(ifc_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size:
+                # The OS pages the file in on demand, so multi-GB files are never
+                # held in memory as a whole
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    for m in _RE_IFCRECORD.finditer(mm):
+                        _IFC_RECORD_SCANNERS[m.lastgroup](m, entities, rels, quantities, globalid_to_eid)
         if debug:
             log_debug_info(f"[IFC PARSE] Entities: {entities}")
             log_debug_info(f"[IFC PARSE] Relationships: {rels}")
@@ -304,19 +459,74 @@ def parse_ifc_entities_and_quantities(ifc_path, debug=False):
             log_debug_info(f"[IFC PARSE ERROR] {e}\n{traceback.format_exc()}")
     return entities, rels, quantities, globalid_to_eid
 
+# The same few property names repeat across every object and pset
+@functools.lru_cache(maxsize=1024)
+def _normalize_param(name):
+    return name.replace('_', '').replace(' ', '').lower()
+
+def build_eid_quantity_map(rels, quantities):
+    """
+    Resolve the quantities of every related entity once.
+    Returns a dict: { eid (int): { normalized_quantity_name: value } }
+    """
+    eid_quantities = {}
+    resolved = {}
+    for eid, qid in rels.items():
+        qmap = resolved.get(qid)
+        if qmap is None:
+            qmap = {}
+            qset = quantities.get(qid) or {}
+            for qref in qset.get('quantities', ()):
+                q = quantities.get(qref)
+                if q and 'value' in q:
+                    qmap.setdefault(_normalize_param(q['name']), q['value'])
+            resolved[qid] = qmap
+        if qmap:
+            eid_quantities[eid] = qmap
+    return eid_quantities
+
+# --- Parsed IFC data, reused until the file changes on disk ---
+def load_ifc_data(ifc_path, debug=False):
+    """
+    Return (units, scales, entities, rels, quantities, globalid_to_eid) for an IFC file.
+    The file is only parsed again when its mtime or size changes.
+    """
+    entry = get_ifc_cache_entry(ifc_path)
+    if 'parsed' not in entry:
+        units, scales = detect_ifc_units(ifc_path, debug=debug)
+        entry['parsed'] = (units, scales) + parse_ifc_entities_and_quantities(ifc_path, debug=debug)
+        rels, quantities = entry['parsed'][3:5]
+        # Resolved once per file version, not on every selection
+        entry['eid_quantities'] = build_eid_quantity_map(rels, quantities)
+        entry['value_tables'] = {}
+    return entry['parsed']
+
+def get_ifc_quantity_lookup(ifc_path):
+    """
+    Return (eid_quantities, value_tables) of a file loaded with load_ifc_data.
+    value_tables is filled lazily by lookup_ifc_values, one entry per parameter.
+    """
+    entry = get_ifc_cache_entry(ifc_path)
+    return entry.get('eid_quantities', {}), entry.setdefault('value_tables', {})
+
 # --- Robust IFC Unit Detection using IfcOpenShell ---
 def detect_ifc_units(ifc_path, debug=False):
     units = {'length': 'm', 'area': 'm²', 'volume': 'm³'}
     scales = {'length': 1.0, 'area': 1.0, 'volume': 1.0}
     try:
         if IFCOPENSHELL_AVAILABLE:
-            ifc_file = ifcopenshell.open(ifc_path)
+            entry = get_ifc_cache_entry(ifc_path)
+            if 'detected_units' in entry:
+                cached_units, cached_scales = entry['detected_units']
+                return dict(cached_units), dict(cached_scales)
+            ifc_file = open_ifc_file(ifc_path)
             for unit_type, key in [("LENGTHUNIT", "length"), ("AREAUNIT", "area"), ("VOLUMEUNIT", "volume")]:
                 u = ifcopenshell.util.unit.get_project_unit(ifc_file, unit_type)
                 s = ifcopenshell.util.unit.calculate_unit_scale(ifc_file, unit_type)
                 if u:
                     units[key] = u.get_info().get('UnitType', u.get_info().get('Name', ''))
                 scales[key] = s
+            entry['detected_units'] = (dict(units), dict(scales))
             if debug:
                 log_debug_info(f"[IfcOpenShell] Detected units: {units}")
                 log_debug_info(f"[IfcOpenShell] Detected scales: {scales}")
@@ -328,181 +538,213 @@ def detect_ifc_units(ifc_path, debug=False):
             log_debug_info(f"[IfcOpenShell] Unit detection error: {e}\n{traceback.format_exc()}")
     return units, scales
 
+# --- Area/Volume integration logic ---
+_AREA_KEYS = ('ManualSurfaceArea', 'GrossArea', 'NetArea')
+_VOLUME_KEYS = ('ManualVolume', 'GrossVolume', 'NetVolume')
+
+def _no_value(key, default=None):
+    return default
+
+def _probe_bim(obj, keys):
+    """
+    Collect (name, value) pairs for keys found in BIMProperties or as custom properties.
+    """
+    vals = []
+    bim = obj.get('BIMProperties')
+    bim_get = bim.get if bim is not None else _no_value
+    obj_get = obj.get
+    for key in keys:
+        for value in (bim_get(key), obj_get(key)):
+            if value is not None:
+                try:
+                    vals.append((key, float(value)))
+                except (TypeError, ValueError):
+                    pass
+    return vals
+
+def get_all_area_values(obj, dims=None):
+    if dims is None:
+        dims = obj.dimensions
+    return _probe_bim(obj, _AREA_KEYS) + [('Geometry', dims[0] * dims[1])]
+
+def get_all_volume_values(obj, dims=None):
+    if dims is None:
+        dims = obj.dimensions
+    return _probe_bim(obj, _VOLUME_KEYS) + [('Geometry', dims[0] * dims[1] * dims[2])]
+
+# --- IFC entity ids stamped on objects, so selections skip the GlobalId lookup ---
+IFC_EID_PROP = "_ifcqs_eid"
+# What the stamp was resolved from; objects are shared by all scenes, which
+# may point at different IFC files
+IFC_EID_FILE_PROP = "_ifcqs_eid_file"
+IFC_EID_GLOBALID_PROP = "_ifcqs_eid_globalid"
+
+def get_object_globalid(obj):
+    return obj.get('IfcGlobalId') or obj.get('GlobalId') or ""
+
+def stamp_ifc_entity_ids(objects, globalid_to_eid, ifc_key):
+    """
+    Store the IFC entity id of each mesh as a custom int property (-1 if unmatched),
+    together with the IFC file key and GlobalId it was resolved from.
+    """
+    for obj in objects:
+        if obj.type != 'MESH' or obj.library is not None:
+            continue
+        globalid = get_object_globalid(obj)
+        eid = globalid_to_eid.get(globalid)
+        obj[IFC_EID_PROP] = eid if eid is not None else -1
+        obj[IFC_EID_FILE_PROP] = ifc_key
+        obj[IFC_EID_GLOBALID_PROP] = globalid
+
+def get_object_eid(obj, globalid_to_eid, ifc_key=""):
+    """
+    The stamped entity id, if it is a match resolved from this file and the
+    object's current GlobalId. Otherwise the GlobalId is looked up directly.
+    """
+    eid = obj.get(IFC_EID_PROP)
+    globalid = get_object_globalid(obj)
+    if (eid is None or eid < 0 or obj.get(IFC_EID_FILE_PROP) != ifc_key
+            or obj.get(IFC_EID_GLOBALID_PROP) != globalid):
+        eid = globalid_to_eid.get(globalid, -1)
+    return int(eid)
+
+def lookup_ifc_values(eids, param, eid_quantities, value_tables=None):
+    """
+    Look up one IFC quantity for an array of entity ids at once.
+    Returns an array with NaN where the entity has no such quantity.
+    The sorted (keys, values) arrays per parameter are kept in value_tables if given.
+    """
+    values = np.full(len(eids), np.nan)
+    cached = value_tables.get(param) if value_tables is not None else None
+    if cached is None:
+        known = {eid: q[param] for eid, q in eid_quantities.items() if param in q}
+        keys = np.fromiter(known.keys(), dtype=np.int64, count=len(known))
+        table = np.fromiter(known.values(), dtype=np.float64, count=len(known))
+        order = np.argsort(keys)
+        cached = (keys[order], table[order])
+        if value_tables is not None:
+            value_tables[param] = cached
+    keys, table = cached
+    if not len(keys) or not len(eids):
+        return values
+    pos = np.minimum(np.searchsorted(keys, eids), len(keys) - 1)
+    hit = keys[pos] == eids
+    values[hit] = table[pos[hit]]
+    return values
+
+def get_bim_value(obj, param):
+    # Try BIMProperties sets
+    if "BIMProperties" in obj:
+        for qset in QUANTITY_SETS:
+            pset = obj["BIMProperties"].get(qset)
+            if pset:
+                for key, val in pset.items():
+                    if _normalize_param(key) == param:
+                        try:
+                            return float(val)
+                        except Exception:
+                            continue
+    return None
+
+def values_differ(values, tolerance=1e-6):
+    if len(values) < 2:
+        return False
+    vs = [v[1] for v in values]
+    return max(vs) - min(vs) > tolerance
+
+MAX_MISMATCH_LINES = 10
+
+def show_value_mismatches(param, mismatches):
+    """
+    Show one popup listing the objects whose area/volume sources disagree.
+    """
+    if not hasattr(bpy.context, 'window_manager'):
+        return
+    lines = [
+        f"Warning: Multiple {param} values found for object '{name}': " + ", ".join(f"{n}={v}" for n, v in values)
+        for name, values in mismatches[:MAX_MISMATCH_LINES]
+    ]
+    if len(mismatches) > MAX_MISMATCH_LINES:
+        lines.append(f"... and {len(mismatches) - MAX_MISMATCH_LINES} more objects")
+    def draw(self, context):
+        for line in lines:
+            self.layout.label(text=line)
+    bpy.context.window_manager.popup_menu(draw, title=f"{param.capitalize()} Mismatch", icon='ERROR')
+
+def apply_selection(context, objects, mask):
+    """
+    Select exactly the objects whose mask entry is True.
+    Objects have no 'select' RNA property for foreach_set, so select_set is
+    only called on objects whose state actually changes.
+    """
+    chosen = [objects[i] for i in np.flatnonzero(mask)]
+    keep = set(chosen)
+    for obj in list(context.view_layer.objects.selected):
+        if obj not in keep:
+            obj.select_set(False)
+    for obj in chosen:
+        if not obj.select_get():
+            obj.select_set(True)
+
 # --- Replace select_matching_objects with a robust, mesh-focused version ---
-def select_matching_objects(context, props, entities, rels, quantities, globalid_to_eid, units, scales, log=True, do_select=True):
-    selected_count = 0
-    param = props.parameter.lower().replace('_', '').replace(' ', '')
+def select_matching_objects(context, props, entities, rels, quantities, globalid_to_eid, units, scales, log=True, do_select=True,
+                            eid_quantities=None, value_tables=None, ifc_key=""):
+    param = _normalize_param(props.parameter)
+    if eid_quantities is None:
+        eid_quantities = build_eid_quantity_map(rels, quantities)
     name_filter = props.name_filter.lower().strip()
     material_filter = props.value_material.lower().strip() if hasattr(props, 'value_material') else ''
-    warning_shown = False
-    for obj in bpy.data.objects:
-        if obj.type != 'MESH':
-            if do_select:
-                obj.select_set(False)
-            continue
-        if name_filter and name_filter not in obj.name.lower():
-            if do_select:
-                obj.select_set(False)
-            continue
-        selected = False
+    mismatches = []
+    # Filter by type and name before reading any per-object data; only objects
+    # in the view layer can be selected at all
+    meshes = [
+        obj for obj in context.view_layer.objects
+        if obj.type == 'MESH' and (not name_filter or name_filter in obj.name.lower())
+    ]
+    # Read all dimensions once so the geometry fallback is computed in one pass
+    dims = np.empty((len(meshes), 3), dtype=np.float64)
+    for i, obj in enumerate(meshes):
+        dims[i] = obj.dimensions
+    geom_fn = PARAM_GEOM_FN.get(props.parameter)
+    geom_values = geom_fn(dims) if geom_fn else None
+    ifc_values = None
+    if eid_quantities:
+        eids = np.fromiter((get_object_eid(obj, globalid_to_eid, ifc_key) for obj in meshes), dtype=np.int64, count=len(meshes))
+        ifc_values = lookup_ifc_values(eids, param, eid_quantities, value_tables)
+    # NaN marks objects without a value; they never fall inside the range
+    object_values = np.full(len(meshes), np.nan)
+    for i, obj in enumerate(meshes):
         value = None
         values = []
-        # --- 1. Area/Volume integration logic ---
-        def get_all_area_values(obj):
-            vals = []
-            # ManualSurfaceArea
-            try:
-                if hasattr(obj, 'BIMProperties') and 'ManualSurfaceArea' in obj.BIMProperties:
-                    vals.append(('ManualSurfaceArea', float(obj.BIMProperties['ManualSurfaceArea'])))
-            except Exception:
-                pass
-            if 'ManualSurfaceArea' in obj:
-                try:
-                    vals.append(('ManualSurfaceArea', float(obj['ManualSurfaceArea'])))
-                except Exception:
-                    pass
-            # GrossArea
-            try:
-                if hasattr(obj, 'BIMProperties') and 'GrossArea' in obj.BIMProperties:
-                    vals.append(('GrossArea', float(obj.BIMProperties['GrossArea'])))
-            except Exception:
-                pass
-            if 'GrossArea' in obj:
-                try:
-                    vals.append(('GrossArea', float(obj['GrossArea'])))
-                except Exception:
-                    pass
-            # NetArea
-            try:
-                if hasattr(obj, 'BIMProperties') and 'NetArea' in obj.BIMProperties:
-                    vals.append(('NetArea', float(obj.BIMProperties['NetArea'])))
-            except Exception:
-                pass
-            if 'NetArea' in obj:
-                try:
-                    vals.append(('NetArea', float(obj['NetArea'])))
-                except Exception:
-                    pass
-            # Geometry fallback
-            dims = obj.dimensions
-            geom_area = dims[0] * dims[1]
-            vals.append(('Geometry', geom_area))
-            return vals
-        def get_all_volume_values(obj):
-            vals = []
-            # ManualVolume
-            try:
-                if hasattr(obj, 'BIMProperties') and 'ManualVolume' in obj.BIMProperties:
-                    vals.append(('ManualVolume', float(obj.BIMProperties['ManualVolume'])))
-            except Exception:
-                pass
-            if 'ManualVolume' in obj:
-                try:
-                    vals.append(('ManualVolume', float(obj['ManualVolume'])))
-                except Exception:
-                    pass
-            # GrossVolume
-            try:
-                if hasattr(obj, 'BIMProperties') and 'GrossVolume' in obj.BIMProperties:
-                    vals.append(('GrossVolume', float(obj.BIMProperties['GrossVolume'])))
-            except Exception:
-                pass
-            if 'GrossVolume' in obj:
-                try:
-                    vals.append(('GrossVolume', float(obj['GrossVolume'])))
-                except Exception:
-                    pass
-            # NetVolume
-            try:
-                if hasattr(obj, 'BIMProperties') and 'NetVolume' in obj.BIMProperties:
-                    vals.append(('NetVolume', float(obj.BIMProperties['NetVolume'])))
-            except Exception:
-                pass
-            if 'NetVolume' in obj:
-                try:
-                    vals.append(('NetVolume', float(obj['NetVolume'])))
-                except Exception:
-                    pass
-            # Geometry fallback
-            dims = obj.dimensions
-            geom_volume = dims[0] * dims[1] * dims[2]
-            vals.append(('Geometry', geom_volume))
-            return vals
-        # --- 2. Main selection logic ---
-        if param == 'area':
-            values = get_all_area_values(obj)
-            # Check for value differences and warn
-            if values:
-                unique_vals = set(round(v[1], 6) for v in values)
-                if len(unique_vals) > 1 and not warning_shown:
-                    msg = f"Warning: Multiple area values found for object '{obj.name}': " + ", ".join(f"{n}={v}" for n, v in values)
-                    if hasattr(bpy.context, 'window_manager'):
-                        bpy.context.window_manager.popup_menu(lambda self, context: self.layout.label(text=msg), title="Area Mismatch", icon='ERROR')
-                    warning_shown = True
-            if values:
-                value = values[0][1]
-        elif param == 'volume':
-            values = get_all_volume_values(obj)
-            if values:
-                unique_vals = set(round(v[1], 6) for v in values)
-                if len(unique_vals) > 1 and not warning_shown:
-                    msg = f"Warning: Multiple volume values found for object '{obj.name}': " + ", ".join(f"{n}={v}" for n, v in values)
-                    if hasattr(bpy.context, 'window_manager'):
-                        bpy.context.window_manager.popup_menu(lambda self, context: self.layout.label(text=msg), title="Volume Mismatch", icon='ERROR')
-                    warning_shown = True
+        # --- Main selection logic ---
+        if param in ('area', 'volume'):
+            if param == 'area':
+                values = get_all_area_values(obj, dims[i])
+            else:
+                values = get_all_volume_values(obj, dims[i])
+            # Collect value differences, reported once after the loop
+            if values_differ(values):
+                mismatches.append((obj.name, values))
             if values:
                 value = values[0][1]
         else:
-            # Use original direct-matching logic for other parameters
-            def get_bim_value(obj, param):
-                # Try GlobalId-based lookup (if available)
-                globalid = obj.get('IfcGlobalId') or obj.get('GlobalId')
-                if globalid and globalid in globalid_to_eid:
-                    eid = globalid_to_eid[globalid]
-                    if eid in rels:
-                        qid = rels[eid]
-                        for qref in re.findall(r'#(\d+)', qid):
-                            q = quantities.get(qref)
-                            if q and q.get('name', '').replace('_', '').replace(' ', '').lower() == param:
-                                return q.get('value')
-                # Try BIMProperties sets
-                if "BIMProperties" in obj:
-                    for qset in QUANTITY_SETS:
-                        pset = obj["BIMProperties"].get(qset)
-                        if pset:
-                            for key, val in pset.items():
-                                if key.replace('_', '').replace(' ', '').lower() == param:
-                                    try:
-                                        return float(val)
-                                    except Exception:
-                                        continue
-                return None
-            value = get_bim_value(obj, param)
+            # IFC quantity (by entity id) first, then BIMProperties sets
+            if ifc_values is not None and not np.isnan(ifc_values[i]):
+                value = ifc_values[i]
+            else:
+                value = get_bim_value(obj, param)
             # Fallback to geometry if no BIM value
-            if value is None:
-                dims = obj.dimensions
-                if param in ['length', 'netlength', 'grosslength']:
-                    value = max(dims)
-                elif param in ['width', 'thickness', 'netwidth', 'grossthickness', 'netthickness', 'grosswidth']:
-                    value = min(dims)
-                elif param in ['height', 'depth', 'netheight', 'grossheight']:
-                    value = sorted(dims)[1]  # middle value
-                elif param in ['perimeter']:
-                    value = 2 * (dims[0] + dims[1])
-                elif param in ['crosssectionarea', 'outersurfacearea']:
-                    value = dims[0] * dims[1]
-        # Selection by value range
+            if value is None and geom_values is not None:
+                value = geom_values[i]
         if value is not None:
-            if props.value_number_min <= value <= props.value_number_max:
-                selected = True
-        if selected:
-            if do_select:
-                obj.select_set(True)
-            selected_count += 1
-        else:
-            if do_select:
-                obj.select_set(False)
-    return selected_count
+            object_values[i] = value
+    if mismatches:
+        show_value_mismatches(param, mismatches)
+    # Selection by value range
+    mask = (object_values >= props.value_number_min) & (object_values <= props.value_number_max)
+    if do_select:
+        apply_selection(context, meshes, mask)
+    return int(mask.sum())
 
 # --- Update Selection Logic to Use GlobalId Matching ---
 class OBJECT_OT_ifcqselect(bpy.types.Operator):
@@ -510,14 +752,34 @@ class OBJECT_OT_ifcqselect(bpy.types.Operator):
     bl_label = "IFC Quick Select Operator"
     def execute(self, context):
         props = context.scene.ifcqselect_props
-        debug = True
+        debug = _logger.isEnabledFor(logging.DEBUG)
         entities, rels, quantities, globalid_to_eid = {}, {}, {}, {}
         units, scales = {'length': 'm', 'area': 'm²', 'volume': 'm³'}, {'length': 1.0, 'area': 1.0, 'volume': 1.0}
-        if props.ifc_file_path:
-            units, scales = detect_ifc_units(props.ifc_file_path, debug=debug)
-            entities, rels, quantities, globalid_to_eid = parse_ifc_entities_and_quantities(props.ifc_file_path, debug=debug)
-        selected_count = select_matching_objects(context, props, entities, rels, quantities, globalid_to_eid, units, scales, log=True, do_select=True)
-        self.report({'INFO'}, f"Selection complete. {selected_count} objects selected. See debug log for details.")
+        eid_quantities, value_tables = {}, None
+        cache_key = ""
+        geometry_only = props.parameter in _GEOM_ONLY_PARAMS and not props.strict_bim
+        if props.ifc_file_path and os.path.isfile(props.ifc_file_path) and not geometry_only:
+            units, scales, entities, rels, quantities, globalid_to_eid = load_ifc_data(props.ifc_file_path, debug=debug)
+            eid_quantities, value_tables = get_ifc_quantity_lookup(props.ifc_file_path)
+            cache_key = "%s:%s:%s" % get_ifc_cache_key(props.ifc_file_path)
+            if cache_key != props.ifc_cache_key:
+                # A different file (version) was loaded; refresh the stamped ids
+                stamp_ifc_entity_ids(bpy.data.objects, globalid_to_eid, cache_key)
+                props.ifc_cache_key = cache_key
+        selected_count = select_matching_objects(context, props, entities, rels, quantities, globalid_to_eid, units, scales, log=True, do_select=True,
+                                                 eid_quantities=eid_quantities, value_tables=value_tables, ifc_key=cache_key)
+        self.report({'INFO'}, f"Selection complete. {selected_count} objects selected.")
+        return {'FINISHED'}
+
+class OBJECT_OT_ifcqselect_reload(bpy.types.Operator):
+    bl_idname = "object.ifcqselect_reload"
+    bl_label = "Reload IFC"
+    bl_description = "Discard the cached IFC data so the file is parsed again on the next selection"
+    def execute(self, context):
+        props = context.scene.ifcqselect_props
+        clear_ifc_cache(props.ifc_file_path or None)
+        props.ifc_cache_key = ""
+        self.report({'INFO'}, "IFC cache cleared.")
         return {'FINISHED'}
 
 class IFCQSelectPanel(bpy.types.Panel):
@@ -547,26 +809,30 @@ class OBJECT_OT_ifcqselect_debug(bpy.types.Operator):
     bl_description = "Run selection logic and log all actions/results to a debug log file"
     def execute(self, context):
         props = context.scene.ifcqselect_props
-        with open(DEBUG_LOG_PATH, "w", encoding="utf-8") as f:
-            f.write("--- IFC Quick Select Debug Log ---\n")
-        log_detected_units()
-        log_debug_info(f"Parameter: {props.parameter}")
-        log_debug_info(f"Min: {props.value_number_min}, Max: {props.value_number_max}")
-        log_debug_info(f"Unit System: {props.unit_system}")
-        log_debug_info(f"Object Type: {props.object_type}")
-        log_debug_info(f"Name Filter: {props.name_filter}")
-        log_debug_info(f"Material Filter: {props.value_material}")
-        logged = 0
-        for obj in bpy.data.objects:
-            if hasattr(obj, "BIMProperties") and logged < 10:
-                log_debug_info(f"\n[DEBUG] BIMProperties for {obj.name}:")
-                for qset, pset in obj.BIMProperties.items():
-                    log_debug_info(f"  {qset}:")
-                    if isinstance(pset, dict):
-                        for k, v in pset.items():
-                            log_debug_info(f"    {k}: {v}")
-                logged += 1
-        selected_count = select_matching_objects(context, props, {}, {}, {}, {}, {}, {}, log=True, do_select=True)
+        reset_debug_log("--- IFC Quick Select Debug Log ---\n")
+        _logger.setLevel(logging.DEBUG)
+        try:
+            log_detected_units()
+            log_debug_info(f"Parameter: {props.parameter}")
+            log_debug_info(f"Min: {props.value_number_min}, Max: {props.value_number_max}")
+            log_debug_info(f"Unit System: {props.unit_system}")
+            log_debug_info(f"Object Type: {props.object_type}")
+            log_debug_info(f"Name Filter: {props.name_filter}")
+            log_debug_info(f"Material Filter: {props.value_material}")
+            logged = 0
+            for obj in bpy.data.objects:
+                bim = obj.get("BIMProperties")
+                if bim is not None and logged < 10:
+                    log_debug_info(f"\n[DEBUG] BIMProperties for {obj.name}:")
+                    for qset, pset in bim.items():
+                        log_debug_info(f"  {qset}:")
+                        if isinstance(pset, dict):
+                            for k, v in pset.items():
+                                log_debug_info(f"    {k}: {v}")
+                    logged += 1
+            selected_count = select_matching_objects(context, props, {}, {}, {}, {}, {}, {}, log=True, do_select=True)
+        finally:
+            _logger.setLevel(logging.INFO)
         self.report({'INFO'}, f"Debug log written. {selected_count} objects selected.")
         return {'FINISHED'}
 
@@ -575,11 +841,56 @@ class OBJECT_OT_ifcqselect_clearlog(bpy.types.Operator):
     bl_label = "Clear IFC Quick Select Debug Log"
     bl_description = "Clear the debug log file for IFC Quick Select"
     def execute(self, context):
-        with open(DEBUG_LOG_PATH, "w", encoding="utf-8") as f:
-            f.write("")
+        reset_debug_log()
         self.report({'INFO'}, "Debug log cleared.")
         return {'FINISHED'}
 
+# --- Pre-formatted BIMProperties lines for the panel ---
+def format_bim_item(key, value):
+    try:
+        return f"{key}: {value:.4f}"
+    except (TypeError, ValueError):
+        return f"{key}: {value}"
+
+def update_bim_pretty(obj):
+    """
+    Cache the panel lines of obj's BIMProperties in its display cache
+    property and drop its memoized readouts. Call after writing BIMProperties.
+    """
+    invalidate_area_memo({obj.as_pointer()})
+    bim = obj.get("BIMProperties")
+    cache = obj.ifcqselect_props
+    pretty = "\n".join(format_bim_item(k, v) for k, v in bim.items()) if bim else ""
+    source = bim_fingerprint(bim) if bim else ""
+    # Only write on change: property writes tag the object for another depsgraph update
+    if cache.bim_display_cache != pretty:
+        cache.bim_display_cache = pretty
+    if cache.bim_display_source != source:
+        cache.bim_display_source = source
+
+def bim_fingerprint(bim):
+    """repr of the BIMProperties keys and values, nested groups included."""
+    return repr(bim.to_dict() if hasattr(bim, 'to_dict') else dict(bim))
+
+def is_bim_display_current(obj, bim):
+    """
+    True if the display cache was built from exactly these keys and values.
+    Edits that bypass update_bim_pretty (Custom Properties panel, scripts)
+    fail this check, so the panel falls back to the live data.
+    """
+    cache = obj.ifcqselect_props
+    return bool(cache.bim_display_cache) and cache.bim_display_source == bim_fingerprint(bim)
+
+@persistent
+def _bim_display_depsgraph_update(scene, depsgraph):
+    # Rebuild stale caches of updated objects so the panel is back on the fast path
+    for update in depsgraph.updates:
+        obj = update.id.original
+        if isinstance(obj, bpy.types.Object) and obj.library is None:
+            bim = obj.get("BIMProperties")
+            if bim and not is_bim_display_current(obj, bim):
+                update_bim_pretty(obj)
+
 class OBJECT_OT_save_selected_face_area(bpy.types.Operator):
     bl_idname = "object.save_selected_face_area"
     bl_label = "Save Selected Face Area to BIM Properties"
@@ -593,116 +904,121 @@ class OBJECT_OT_save_selected_face_area(bpy.types.Operator):
         if context.mode != 'EDIT_MESH':
             self.report({'ERROR'}, "Must be in Edit Mode with faces selected.")
             return {'CANCELLED'}
-        import bmesh
-        bm = bmesh.from_edit_mesh(obj.data)
-        area = sum(f.calc_area() for f in bm.faces if f.select)
+        area = get_selected_faces_area(obj)
         # Detect units
-        _, unit = get_selected_faces_area_and_unit(context)
+        unit = get_selected_faces_unit(context, obj)
         # Store in BIMProperties
-        if not hasattr(obj, 'BIMProperties'):
-            obj["BIMProperties"] = {}
-        try:
-            bimprops = obj.BIMProperties
-            bimprops['ManualSurfaceArea'] = area
-            bimprops['ManualSurfaceAreaUnit'] = unit
-        except Exception:
-            obj["ManualSurfaceArea"] = area
-            obj["ManualSurfaceAreaUnit"] = unit
+        save_all_ifc_properties_to_blender(obj, {'ManualSurfaceArea': area, 'ManualSurfaceAreaUnit': unit})
         self.report({'INFO'}, f"Saved area: {area:.4f} {unit} to BIMProperties['ManualSurfaceArea']")
         return {'FINISHED'}
 
 # --- Helper to get area and units for selected faces ---
+def get_selected_faces_area(obj):
+    """
+    Sum the area of the selected faces of a mesh in Edit Mode.
+    The edit-mesh is written back to the mesh data so that face areas and
+    selection flags can be read in bulk with foreach_get.
+    """
+    obj.update_from_editmode()
+    polygons = obj.data.polygons
+    areas = np.empty(len(polygons), dtype=np.float32)
+    selected = np.empty(len(polygons), dtype=bool)
+    polygons.foreach_get("area", areas)
+    polygons.foreach_get("select", selected)
+    return float(areas[selected].sum(dtype=np.float64))
+
+# --- Memo of the selected-face area the panel draws (it redraws constantly); save operators always recompute ---
+_AREA_MEMO = {}  # (readout, mode, object ptr, mesh ptr, unit system, length unit) -> (value, unit)
+_AREA_MEMO_MAX = 1024
+
+def invalidate_area_memo(pointers=None):
+    """Drop memoized readouts of the given object/mesh pointers, or all of them."""
+    if pointers is None:
+        _AREA_MEMO.clear()
+        return
+    for key in [k for k in _AREA_MEMO if k[2] in pointers or k[3] in pointers]:
+        del _AREA_MEMO[key]
+
+@persistent
+def _area_memo_depsgraph_update(scene, depsgraph):
+    if _AREA_MEMO:
+        invalidate_area_memo({update.id.original.as_pointer() for update in depsgraph.updates})
+
+def _memo_readout(fn):
+    """Memoize a (value, unit) readout of the active mesh until it or its mesh updates."""
+    @functools.wraps(fn)
+    def wrapper(context):
+        obj = context.active_object
+        if obj is None or obj.type != 'MESH':
+            return fn(context)
+        us = context.scene.unit_settings
+        key = (fn.__name__, context.mode, obj.as_pointer(), obj.data.as_pointer(), us.system, us.length_unit)
+        try:
+            return _AREA_MEMO[key]
+        except KeyError:
+            pass
+        if len(_AREA_MEMO) >= _AREA_MEMO_MAX:
+            _AREA_MEMO.clear()
+        result = _AREA_MEMO[key] = fn(context)
+        return result
+    return wrapper
+
+@_memo_readout
 def get_selected_faces_area_and_unit(context):
     obj = context.active_object
     if obj is None or obj.type != 'MESH' or context.mode != 'EDIT_MESH':
         return 0.0, 'm²'
-    import bmesh
+    # Used while drawing the panel, where mesh data must not be written, so the
+    # edit-mesh is read directly instead of going through update_from_editmode
     bm = bmesh.from_edit_mesh(obj.data)
     area = sum(f.calc_area() for f in bm.faces if f.select)
+    return area, get_selected_faces_unit(context, obj)
+
+def get_selected_faces_unit(context, obj):
     # Prefer IFC units if available
     unit = None
-    if hasattr(obj, 'BIMProperties') and 'IfcUnit' in obj.BIMProperties and obj.BIMProperties['IfcUnit']:
-        unit = str(obj.BIMProperties['IfcUnit'])
+    bim = obj.get('BIMProperties')
+    if bim is not None and bim.get('IfcUnit'):
+        unit = str(bim['IfcUnit'])
     if not unit or unit.lower() in ('', 'none', 'unknown'):
         # Fallback to Blender scene units
-        try:
-            scene = context.scene
-            us = scene.unit_settings
-            if us.system == 'IMPERIAL':
-                if us.length_unit == 'FEET':
-                    unit = 'ft²'
-                elif us.length_unit == 'INCHES':
-                    unit = 'in²'
-                else:
-                    unit = 'imperial'
-            elif us.system == 'METRIC':
-                if us.length_unit == 'MILLIMETERS':
-                    unit = 'mm²'
-                elif us.length_unit == 'CENTIMETERS':
-                    unit = 'cm²'
-                elif us.length_unit == 'METERS':
-                    unit = 'm²'
-                else:
-                    unit = 'm²'
-            else:
-                unit = 'm²'
-        except Exception:
-            unit = 'm²'
-    return area, unit
+        unit = get_scene_unit_symbol(context, _AREA_UNIT, 'm²')
+    return unit
 
 # --- Helper to get object volume and units ---
+def get_mesh_volume(obj):
+    """
+    World-space volume of a mesh object from the signed volumes of the
+    tetrahedra spanned by the origin and each loop triangle.
+    Works on the mesh buffers directly instead of copying the mesh into a bmesh.
+    """
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    co = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    v0, v1, v2 = (co[tris[i::3]] for i in range(3))
+    # Like bmesh calc_volume(signed=False): sum signed volumes, then take abs
+    return abs(float(np.einsum('ij,ij->i', v0, np.cross(v1, v2)).sum())) / 6.0
+
 def get_object_volume_and_unit(context):
     obj = context.active_object
     if obj is None or obj.type != 'MESH' or context.mode != 'OBJECT':
         return 0.0, 'm³'
-    import bmesh
-    mesh = obj.to_mesh()
-    mesh.transform(obj.matrix_world)
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    volume = bm.calc_volume(signed=False)
-    bm.free()
-    obj.to_mesh_clear()
+    volume = get_mesh_volume(obj)
     # Prefer IFC units for volume if available
     unit = None
-    if hasattr(obj, 'BIMProperties') and 'IfcUnit' in obj.BIMProperties and obj.BIMProperties['IfcUnit']:
+    bim = obj.get('BIMProperties')
+    if bim is not None and bim.get('IfcUnit'):
         # Try to infer volume unit from IFC unit (e.g., m³ if m, ft³ if ft)
-        ifc_unit = str(obj.BIMProperties['IfcUnit'])
-        if ifc_unit == 'm':
-            unit = 'm³'
-        elif ifc_unit == 'ft':
-            unit = 'ft³'
-        elif ifc_unit == 'cm':
-            unit = 'cm³'
-        elif ifc_unit == 'mm':
-            unit = 'mm³'
-        else:
-            unit = ifc_unit + '³'
+        ifc_unit = str(bim['IfcUnit'])
+        unit = _IFC_VOLUME_UNIT.get(ifc_unit, ifc_unit + '³')
     if not unit or unit.lower() in ('', 'none', 'unknown'):
         # Fallback to Blender scene units
-        try:
-            scene = context.scene
-            us = scene.unit_settings
-            if us.system == 'IMPERIAL':
-                if us.length_unit == 'FEET':
-                    unit = 'ft³'
-                elif us.length_unit == 'INCHES':
-                    unit = 'in³'
-                else:
-                    unit = 'imperial'
-            elif us.system == 'METRIC':
-                if us.length_unit == 'MILLIMETERS':
-                    unit = 'mm³'
-                elif us.length_unit == 'CENTIMETERS':
-                    unit = 'cm³'
-                elif us.length_unit == 'METERS':
-                    unit = 'm³'
-                else:
-                    unit = 'm³'
-            else:
-                unit = 'm³'
-        except Exception:
-            unit = 'm³'
+        unit = get_scene_unit_symbol(context, _VOLUME_UNIT, 'm³')
     return volume, unit
 
 # --- Operator to save object volume ---
@@ -717,15 +1033,7 @@ class OBJECT_OT_save_object_volume(bpy.types.Operator):
             self.report({'ERROR'}, "Active object must be a mesh in Object Mode.")
             return {'CANCELLED'}
         volume, unit = get_object_volume_and_unit(context)
-        if not hasattr(obj, 'BIMProperties'):
-            obj["BIMProperties"] = {}
-        try:
-            bimprops = obj.BIMProperties
-            bimprops['ManualVolume'] = volume
-            bimprops['ManualVolumeUnit'] = unit
-        except Exception:
-            obj["ManualVolume"] = volume
-            obj["ManualVolumeUnit"] = unit
+        save_all_ifc_properties_to_blender(obj, {'ManualVolume': volume, 'ManualVolumeUnit': unit})
         self.report({'INFO'}, f"Saved volume: {volume:.4f} {unit} to BIMProperties['ManualVolume']")
         return {'FINISHED'}
 
@@ -753,29 +1061,7 @@ def get_object_area_and_unit(context):
         area = dims[0] * dims[1]
     # Unit fallback logic
     if not unit or unit.lower() in ('', 'none', 'unknown'):
-        try:
-            scene = context.scene
-            us = scene.unit_settings
-            if us.system == 'IMPERIAL':
-                if us.length_unit == 'FEET':
-                    unit = 'ft²'
-                elif us.length_unit == 'INCHES':
-                    unit = 'in²'
-                else:
-                    unit = 'imperial'
-            elif us.system == 'METRIC':
-                if us.length_unit == 'MILLIMETERS':
-                    unit = 'mm²'
-                elif us.length_unit == 'CENTIMETERS':
-                    unit = 'cm²'
-                elif us.length_unit == 'METERS':
-                    unit = 'm²'
-                else:
-                    unit = 'm²'
-            else:
-                unit = 'm²'
-        except Exception:
-            unit = 'm²'
+        unit = get_scene_unit_symbol(context, _AREA_UNIT, 'm²')
     return area, unit
 
 # --- Operator to save IFC area to BIM Properties ---
@@ -790,15 +1076,7 @@ class OBJECT_OT_save_object_ifc_area(bpy.types.Operator):
             self.report({'ERROR'}, "Active object must be a mesh in Object Mode.")
             return {'CANCELLED'}
         area, unit = get_object_area_and_unit(context)
-        if not hasattr(obj, 'BIMProperties'):
-            obj["BIMProperties"] = {}
-        try:
-            bimprops = obj.BIMProperties
-            bimprops['ManualSurfaceArea'] = area
-            bimprops['ManualSurfaceAreaUnit'] = unit
-        except Exception:
-            obj["ManualSurfaceArea"] = area
-            obj["ManualSurfaceAreaUnit"] = unit
+        save_all_ifc_properties_to_blender(obj, {'ManualSurfaceArea': area, 'ManualSurfaceAreaUnit': unit})
         self.report({'INFO'}, f"Saved area: {area:.4f} {unit} to BIMProperties['ManualSurfaceArea']")
         return {'FINISHED'}
 
@@ -806,16 +1084,15 @@ class OBJECT_OT_save_object_ifc_area(bpy.types.Operator):
 def save_all_ifc_properties_to_blender(obj, ifc_props_dict):
     """
     Save all IFC properties from a dict to Blender's custom properties for the object.
+    This is the single write path into the BIMProperties ID property group.
     """
-    if not hasattr(obj, 'BIMProperties'):
-        obj["BIMProperties"] = {}
-    try:
-        bimprops = obj.BIMProperties
-        for k, v in ifc_props_dict.items():
-            bimprops[k] = v
-    except Exception:
-        for k, v in ifc_props_dict.items():
-            obj[k] = v
+    # Merge into a plain dict and assign the group once, instead of one
+    # ID-property write per key
+    bim = obj.get("BIMProperties")
+    values = bim.to_dict() if hasattr(bim, 'to_dict') else dict(bim or {})
+    values.update(ifc_props_dict)
+    obj["BIMProperties"] = values
+    update_bim_pretty(obj)
 
 # --- Update panel draw for live inspector ---
 old_draw = IFCQSelectPanel.draw
@@ -825,6 +1102,8 @@ def new_draw(self, context):
     obj = context.active_object
     if context.mode == 'OBJECT':
         self.layout.prop(props, "ifc_file_path", text="IFC File")
+        if props.ifc_cache_key:
+            self.layout.operator("object.ifcqselect_reload", icon='FILE_REFRESH', text="Reload IFC")
         self.layout.operator("object.pull_all_ifc_quantities", icon='IMPORT', text="Pull All Quantities from IFC")
         self.layout.prop(props, "name_contains", text="Name Contains")
         self.layout.prop(props, "select_quantity_type", text="Quantity Type")
@@ -835,8 +1114,13 @@ def new_draw(self, context):
         bim = obj["BIMProperties"]
         self.layout.separator()
         self.layout.label(text="IFC Quantities:")
-        for key, value in bim.items():
-            self.layout.label(text=f"{key}: {value:.4f}")
+        if is_bim_display_current(obj, bim):
+            lines = obj.ifcqselect_props.bim_display_cache.splitlines()
+        else:
+            # No cache yet, or keys changed behind its back (draw may not write props)
+            lines = [format_bim_item(key, value) for key, value in bim.items()]
+        for line in lines:
+            self.layout.label(text=line)
     if context.mode == 'EDIT_MESH':
         area, unit = get_selected_faces_area_and_unit(context)
         self.layout.separator()
@@ -855,34 +1139,46 @@ def get_ifc_txt_cache_path(ifc_path):
 def ensure_ifc_txt_cache(ifc_path):
     txt_path = get_ifc_txt_cache_path(ifc_path)
     if not os.path.exists(txt_path) or os.path.getmtime(txt_path) < os.path.getmtime(ifc_path):
-        shutil.copy2(ifc_path, txt_path)
+        # The cache is only ever read, so a hard link is as good as a copy
+        if os.path.lexists(txt_path):
+            os.remove(txt_path)
+        try:
+            os.link(ifc_path, txt_path)
+        except OSError:
+            shutil.copyfile(ifc_path, txt_path)
     return txt_path
 
-# --- IFC Element Matching Utilities ---
-def find_ifc_line_by_guid(txt_lines, guid):
-    # Match lines like: IFCSLAB('0Yum10KqXDCB1RoWVMXOwE',$,'SM_PCC',...)
-    pattern = re.compile(r"IFCSLAB\('%s',\$,'([^']+)'" % re.escape(guid))
-    for line in txt_lines:
-        if pattern.search(line):
-            return line
-    return None
+# --- Name/GUID line index, built once per .txt cache version ---
+_IFC_INDEX_CACHE = {}  # txt_path -> (mtime, index_by_name, index_by_guid)
+_RE_IFC_HEADER = re.compile(r"=IFC[A-Z]+\('([^']+)',\$,'([^']+)'")
+# Whole entity lines with the same header, matched directly on the mapped file
+_RE_IFC_HEADER_LINE = re.compile(rb"(#\d+=IFC[A-Z]+\('([^'\n]+)',\$,'([^'\n]+)'[^\n]*)")
 
-def find_ifc_line_by_name(txt_lines, name):
-    # Blender object names are like 'IfcWall/Wall01', 'IfcBeam/BeamA', etc.
-    # IFC name is third argument in any IFC entity line (e.g., IFCWALL, IFCSLAB, etc.)
-    # Always extract the part after the slash for matching
-    if '/' in name:
-        name = name.split('/')[-1]
-    # Match lines like: IFCWALL('...',$,'Wall01',...) or IFCSLAB('...',$,'SM_PCC',...)
-    pattern = re.compile(r"IFC[A-Z]+\('([^']+)',\$,'%s'" % re.escape(name))
-    for line in txt_lines:
-        if pattern.search(line):
-            return line
-    return None
+def get_ifc_line_index(txt_path):
+    """Return (index_by_name, index_by_guid) for a .txt cache; the first line wins."""
+    mtime = os.path.getmtime(txt_path)
+    cached = _IFC_INDEX_CACHE.get(txt_path)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+    index_by_name = {}
+    index_by_guid = {}
+    with open(txt_path, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                for m in _RE_IFC_HEADER_LINE.finditer(mm):
+                    line, guid, name = m.groups()
+                    line = _decode(line)
+                    index_by_guid.setdefault(_decode(guid), line)
+                    index_by_name.setdefault(_decode(name), line)
+    _IFC_INDEX_CACHE[txt_path] = (mtime, index_by_name, index_by_guid)
+    return index_by_name, index_by_guid
 
-# In match_ifc_element, clarify name extraction:
-def match_ifc_element(obj, txt_path):
-    guid = (
+# --- IFC Element Matching Utilities ---
+def get_object_guid(obj):
+    return (
         obj.get('IfcGuid') or
         getattr(obj, 'IfcGuid', None) or
         obj.get('GlobalId') or
@@ -890,77 +1186,157 @@ def match_ifc_element(obj, txt_path):
         obj.get('globalid') or
         getattr(obj, 'globalid', None)
     )
+
+# --- Single-pass index of the .txt cache for quantity pulls ---
+_QTY_ARGS = re.compile(r"'([^']+)'[,$][^,]*,[^,]*,([^,]+)")
+# One pass over the mapped file. Each alternative tokenizes its record and ends
+# with an empty marker group, so m.lastgroup names the record type.
+_RE_TXT_DISPATCH = re.compile(
+    rb"#(?P<ref>\d+)=(?:"
+    rb"IFCRELDEFINESBYPROPERTIES\([^;\n]*?\((?P<related>#[#\d,\s]*)\)\s*,\s*#(?P<relating>\d+)(?P<rel>)"
+    rb"|(?:IFCELEMENTQUANTITY|IFCPROPERTYSET)\((?P<members>[^;\n]*)(?P<qset>)"
+    rb"|IFCQUANTITY\w+\((?P<args>[^\n]*)(?P<qty>)"
+    rb")")
+
+class IfcIndex:
+    """
+    Relationship, quantity set and quantity tables of an IFC .txt cache.
+    Built with one pass over the file, so each object only needs dict lookups.
+    """
+    def __init__(self, txt_path):
+        self.txt_path = txt_path
+        # Refs are int entity ids (#12 -> 12)
+        self.rels_by_entity = {}  # entity id -> [property definition ids]
+        self.qsets = {}           # IFCELEMENTQUANTITY/IFCPROPERTYSET id -> [member ids]
+        self.quantity_lines = {}  # IFCQUANTITY* id -> raw argument bytes, parsed on first use
+        self.quantities = {}      # IFCQUANTITY* id -> (name, value) or None
+        with open(txt_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    rels_by_entity = self.rels_by_entity
+                    for m in _RE_TXT_DISPATCH.finditer(mm):
+                        kind = m.lastgroup
+                        if kind == 'qty':
+                            self.quantity_lines[int(m.group('ref'))] = m.group('args')
+                        elif kind == 'rel':
+                            relating = int(m.group('relating'))
+                            for entity_id in _RE_IFCREF.findall(m.group('related')):
+                                rels_by_entity.setdefault(int(entity_id), []).append(relating)
+                        else:
+                            self.qsets[int(m.group('ref'))] = [int(r) for r in _RE_IFCREF.findall(m.group('members'))]
+
+    @staticmethod
+    def _parse_quantity(args):
+        # Extract all possible quantity types and names
+        args = _decode(args)
+        m = _QTY_ARGS.match(args)
+        if m:
+            parts = args.split(',', 4)
+            if len(parts) > 3:
+                try:
+                    val = float(parts[3].replace(')', '').replace(';', '').replace('$', '').strip())
+                except Exception:
+                    return None
+                return m.group(1), val
+        return None
+
+    def get_quantity(self, q_ref):
+        """(name, value) of a quantity id; only referenced quantity lines are ever parsed."""
+        try:
+            return self.quantities[q_ref]
+        except KeyError:
+            pass
+        args = self.quantity_lines.get(q_ref)
+        q = self.quantities[q_ref] = self._parse_quantity(args) if args else None
+        return q
+
+    def get_quantities(self, entity_ref):
+        quantities = {}
+        for set_ref in self.rels_by_entity.get(entity_ref, ()):
+            for q_ref in self.qsets.get(set_ref, ()):
+                q = self.get_quantity(q_ref)
+                if q:
+                    quantities[q[0]] = q[1]
+        return quantities
+
+# --- Quantity index sidecar (<txt_path>.idx.pkl), reused across sessions ---
+_IFC_QTY_INDEX_VERSION = 1
+_IFC_QTY_INDEX_CACHE = {}  # ifc_path -> index dict
+
+def build_ifc_quantity_index(txt_path, mtime):
+    """
+    Resolve the quantities of every named IFC entity in one pass.
+    Entries are (entity_ref, guid, name, quantities), shared by both lookups.
+    """
+    index = IfcIndex(txt_path)
+    index_by_name, index_by_guid = get_ifc_line_index(txt_path)
+    entries = {}
+    by_name = {}
+    by_guid = {}
+    for lookup, target in ((index_by_name, by_name), (index_by_guid, by_guid)):
+        for key, line in lookup.items():
+            entry = entries.get(line)
+            if entry is None:
+                m = _RE_IFC_HEADER.search(line)
+                entity_ref = line.split('=')[0].strip()
+                entry = entries[line] = (entity_ref, m.group(1), m.group(2), index.get_quantities(int(entity_ref[1:])))
+            target[key] = entry
+    return {'version': _IFC_QTY_INDEX_VERSION, 'mtime': mtime, 'by_name': by_name, 'by_guid': by_guid}
+
+def ensure_ifc_index_cache(ifc_path):
+    """Return the quantity index of an IFC file, from memory, the sidecar, or a fresh build."""
+    mtime = os.path.getmtime(ifc_path)
+    idx = _IFC_QTY_INDEX_CACHE.get(ifc_path)
+    if idx and idx['mtime'] == mtime:
+        return idx
+    txt_path = ensure_ifc_txt_cache(ifc_path)
+    pkl_path = txt_path + '.idx.pkl'
+    idx = None
+    if os.path.exists(pkl_path):
+        try:
+            with open(pkl_path, 'rb') as f:
+                idx = pickle.load(f)
+        except Exception as e:
+            print(f"[WARNING] Could not read IFC index cache {pkl_path}: {e}")
+        if not isinstance(idx, dict) or idx.get('version') != _IFC_QTY_INDEX_VERSION or idx.get('mtime') != mtime:
+            idx = None
+    if idx is None:
+        idx = build_ifc_quantity_index(txt_path, mtime)
+        tmp_path = pkl_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(idx, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, pkl_path)
+        except OSError as e:
+            print(f"[WARNING] Could not write IFC index cache {pkl_path}: {e}")
+    _IFC_QTY_INDEX_CACHE[ifc_path] = idx
+    return idx
+
+# --- Modified quantity pull to use .txt cache for parsing ---
+def pull_all_ifc_quantities_to_blender(obj, index):
+    guid = get_object_guid(obj)
     # Always extract the part after the slash for name matching
     name = obj.name.split('/')[-1] if obj.name else None
-    with open(txt_path, 'r', encoding='utf-8', errors='ignore') as f:
-        txt_lines = f.readlines()
-    line = None
-    # Name-based matching is now primary
+    entry = None
+    # Name-based matching is primary
     if name:
-        line = find_ifc_line_by_name(txt_lines, name)
-        if line and guid and guid not in line:
-            print(f"[WARNING] Name matched but GUID '{guid}' not found in line: {line.strip()}")
-    if not line and guid:
-        line = find_ifc_line_by_guid(txt_lines, guid)
-        if line and name and name not in line:
-            print(f"[WARNING] GUID matched but name '{name}' not found in line: {line.strip()}")
-    return line
-
-# --- Modified quantity pull to use .txt cache for parsing ---
-def pull_all_ifc_quantities_to_blender(obj, ifc_path):
-    if not ifc_path or not os.path.exists(ifc_path):
-        return False, 'No IFC file path set or file does not exist.'
-    txt_path = ensure_ifc_txt_cache(ifc_path)
-    line = match_ifc_element(obj, txt_path)
-    if not line:
+        entry = index['by_name'].get(name)
+        if entry and guid and guid != entry[1]:
+            print(f"[WARNING] Name matched but GUID '{guid}' differs from {entry[0]} ('{entry[1]}')")
+    if not entry and guid:
+        entry = index['by_guid'].get(guid)
+        if entry and name and name != entry[2]:
+            print(f"[WARNING] GUID matched but name '{name}' differs from {entry[0]} ('{entry[2]}')")
+    if not entry:
         return False, 'No matching IFC element found for this object (by name or GUID) in .txt cache.'
-    entity_ref = line.split('=')[0].strip() if '=' in line else None
-    if not entity_ref:
-        return False, 'Could not extract entity reference.'
-    # Streaming approach: process file line by line, build minimal maps
-    rels = set()
-    qsets = {}
-    quantities = {}
-    # First pass: find all IFCRELDEFINESBYPROPERTIES referencing the entity
-    with open(txt_path, 'r', encoding='utf-8', errors='ignore') as f:
-        for l in f:
-            if 'IFCRELDEFINESBYPROPERTIES' in l and f'({entity_ref})' in l:
-                parts = l.split(',')
-                ref = parts[-1].replace(')','').replace(';','').strip()
-                rels.add(ref)
-    # Second pass: find all IFCELEMENTQUANTITY/IFCPROPERTYSET and their referenced quantities
-    with open(txt_path, 'r', encoding='utf-8', errors='ignore') as f:
-        for l in f:
-            if ('IFCELEMENTQUANTITY' in l or 'IFCPROPERTYSET' in l):
-                set_ref = l.split('=')[0].strip()
-                if set_ref in rels:
-                    if '(' in l and ')' in l:
-                        tuple_str = l[l.find('(')+1:l.rfind(')')]
-                        refs = [r.strip() for r in tuple_str.split(',') if r.strip().startswith('#')]
-                        qsets[set_ref] = refs
-    # Third pass: find all referenced IFCQUANTITY* lines
-    all_qrefs = set()
-    for refs in qsets.values():
-        all_qrefs.update(refs)
-    with open(txt_path, 'r', encoding='utf-8', errors='ignore') as f:
-        for l in f:
-            if 'IFCQUANTITY' in l:
-                q_ref = l.split('=')[0].strip()
-                if q_ref in all_qrefs:
-                    # Extract all possible quantity types and names
-                    m = re.match(r"#\d+=IFCQUANTITY\w+\('([^']+)'[,$][^,]*,[^,]*,([^,]+)", l)
-                    if m:
-                        qname = m.group(1)
-                        parts = l.split(',')
-                        if len(parts) > 3:
-                            try:
-                                val = float(parts[3].replace(')', '').replace(';', '').replace('$', '').strip())
-                                quantities[qname] = val
-                            except Exception:
-                                pass
+    quantities = entry[3]
     if not quantities:
         return False, 'No IFC quantities found for this object.'
     obj["BIMProperties"] = quantities
+    update_bim_pretty(obj)
     return True, f'Copied {len(quantities)} IFC properties to BIMProperties (from .txt cache).'
 
 class OBJECT_OT_pull_all_ifc_quantities(bpy.types.Operator):
@@ -971,13 +1347,18 @@ class OBJECT_OT_pull_all_ifc_quantities(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.ifcqselect_props
         ifc_path = getattr(props, 'ifc_file_path', None)
+        if not ifc_path or not os.path.exists(ifc_path):
+            self.report({'ERROR'}, 'No IFC file path set or file does not exist.')
+            return {'CANCELLED'}
+        # Index the file once for all selected objects (cached on disk between sessions)
+        index = ensure_ifc_index_cache(ifc_path)
         selected = context.selected_objects
         updated = 0
         errors = []
         wm = context.window_manager
         wm.progress_begin(0, len(selected))
         for idx, obj in enumerate(selected):
-            ok, msg = pull_all_ifc_quantities_to_blender(obj, ifc_path)
+            ok, msg = pull_all_ifc_quantities_to_blender(obj, index)
             if ok:
                 updated += 1
             else:
@@ -998,27 +1379,28 @@ class OBJECT_OT_ifcqselect_by_quantity(bpy.types.Operator):
         vmin = props.select_value_min
         vmax = props.select_value_max
         name_filter = props.name_contains.strip().lower()
-        matched = 0
-        for ob in context.scene.objects:
-            name = ob.name.lower() if ob.name else ""
-            if name_filter and name_filter not in name:
-                ob.select_set(False)
-                continue
-            if "BIMProperties" in ob and ob["BIMProperties"] and quantity_type in ob["BIMProperties"]:
-                val = ob["BIMProperties"][quantity_type]
-                if vmin <= val <= vmax:
-                    ob.select_set(True)
-                    matched += 1
-                else:
-                    ob.select_set(False)
-            else:
-                ob.select_set(False)
+        objs = list(context.scene.objects)
+        # One ID-property lookup per object; no throwaway default dicts
+        nan = np.nan
+        bims = [ob.get("BIMProperties") for ob in objs]
+        vals = np.fromiter(
+            (nan if bim is None else bim.get(quantity_type, nan) for bim in bims),
+            dtype=np.float64, count=len(objs))
+        mask = (vals >= vmin) & (vals <= vmax)
+        if name_filter:
+            # Case-insensitive search; no lowered copy of every object name
+            match_name = re.compile(re.escape(name_filter), re.IGNORECASE).search
+            mask &= np.fromiter((match_name(ob.name) is not None for ob in objs), dtype=bool, count=len(objs))
+        apply_selection(context, objs, mask)
+        matched = int(mask.sum())
         self.report({'INFO'}, f"Selected {matched} objects by {quantity_type} in range [{vmin}, {vmax}] with name filter '{name_filter}'.")
         return {'FINISHED'}
 
 def register():
     bpy.utils.register_class(IFCQSelectProps)
+    bpy.utils.register_class(IFCQSelectObjectProps)
     bpy.utils.register_class(OBJECT_OT_ifcqselect)
+    bpy.utils.register_class(OBJECT_OT_ifcqselect_reload)
     bpy.utils.register_class(IFCQSelectPanel)
     bpy.utils.register_class(OBJECT_OT_ifcqselect_debug)
     bpy.utils.register_class(OBJECT_OT_ifcqselect_clearlog)
@@ -1028,10 +1410,18 @@ def register():
     bpy.utils.register_class(OBJECT_OT_pull_all_ifc_quantities)
     bpy.utils.register_class(OBJECT_OT_ifcqselect_by_quantity)
     bpy.types.Scene.ifcqselect_props = bpy.props.PointerProperty(type=IFCQSelectProps)
+    bpy.types.Object.ifcqselect_props = bpy.props.PointerProperty(type=IFCQSelectObjectProps)
+    bpy.app.handlers.depsgraph_update_post.append(_area_memo_depsgraph_update)
+    bpy.app.handlers.depsgraph_update_post.append(_bim_display_depsgraph_update)
 
 def unregister():
+    for handler in (_area_memo_depsgraph_update, _bim_display_depsgraph_update):
+        if handler in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(handler)
+    invalidate_area_memo()
     bpy.utils.unregister_class(IFCQSelectPanel)
     bpy.utils.unregister_class(OBJECT_OT_ifcqselect)
+    bpy.utils.unregister_class(OBJECT_OT_ifcqselect_reload)
     bpy.utils.unregister_class(OBJECT_OT_ifcqselect_debug)
     bpy.utils.unregister_class(OBJECT_OT_ifcqselect_clearlog)
     bpy.utils.unregister_class(OBJECT_OT_save_selected_face_area)
@@ -1040,7 +1430,10 @@ def unregister():
     bpy.utils.unregister_class(OBJECT_OT_pull_all_ifc_quantities)
     bpy.utils.unregister_class(OBJECT_OT_ifcqselect_by_quantity)
     bpy.utils.unregister_class(IFCQSelectProps)
+    bpy.utils.unregister_class(IFCQSelectObjectProps)
     del bpy.types.Scene.ifcqselect_props
+    del bpy.types.Object.ifcqselect_props
+    _log_handler.close()
 
 if __name__ == "__main__":
     register() 
\ No newline at end of file